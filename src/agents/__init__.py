@@ -1,5 +1,6 @@
 """Agent implementations."""
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, configure_logging
+from .response_cache import ResponseCache, get_response_cache
 
-__all__ = ["BaseAgent"]
+__all__ = ["BaseAgent", "configure_logging", "ResponseCache", "get_response_cache"]
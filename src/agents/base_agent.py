@@ -6,20 +6,75 @@ Each agent extends this base class and implements specific tools and behaviors.
 """
 
 import os
+import queue
+import asyncio
 import logging
-from typing import List, Optional
+import threading
+from typing import (
+    TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterator, List, Literal, Mapping,
+    Optional, Tuple
+)
 from dotenv import load_dotenv
-from strands import Agent, tool
-from strands.models.anthropic import AnthropicModel
+
+from src.agents.response_cache import get_response_cache
+
+if TYPE_CHECKING:
+    from strands.models.anthropic import AnthropicModel
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for command-line entry points.
+
+    Library modules only create loggers; scripts call this from main() so
+    that importing the package never installs handlers.
+
+    Args:
+        level (int): Logging level for the root logger
+    """
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+
+TaskTier = Literal["fast", "balanced", "quality"]
+
+
+def _get_model(
+    api_key: str, model_id: str, max_tokens: int, temperature: float
+) -> "AnthropicModel":
+    """
+    Create a model with its own Anthropic client.
+
+    Models are not shared between agents: the Strand Agent's synchronous
+    call runs each invocation on a fresh event loop in a new thread, and
+    an async HTTP client's connection pool must not be driven from
+    several loops at once. Each agent still reuses its client's
+    keep-alive connections across its own invocations.
+
+    Args:
+        api_key (str): Anthropic API key
+        model_id (str): Model identifier
+        max_tokens (int): Maximum tokens per response
+        temperature (float): Sampling temperature
+
+    Returns:
+        AnthropicModel: Shared Anthropic model instance
+    """
+    from src.agents.caching_model import (
+        PROMPT_CACHING_HEADERS,
+        PromptCachingAnthropicModel,
+    )
+
+    return PromptCachingAnthropicModel(
+        client_args={"api_key": api_key, "default_headers": PROMPT_CACHING_HEADERS},
+        max_tokens=max_tokens,
+        model_id=model_id,
+        params={"temperature": temperature}
+    )
 
 
 class BaseAgent:
@@ -35,9 +90,54 @@ class BaseAgent:
     Each specialized agent should extend this class and implement:
     - get_tools(): Return list of agent-specific tools
     - execute(): Define agent-specific execution logic
+
+    Subclasses may override SYSTEM_PREAMBLE with static instructions. It is
+    sent as the system prompt and marked for Anthropic prompt caching, so
+    keep per-task text out of it. Per-task prompts are rendered from
+    PROMPT_TEMPLATE, whose format_map is bound once per class.
+
+    Agents created with task_tier="auto" pick a model tier per task via
+    route_for(), which the coordinator calls before dispatching a task.
     """
 
-    def __init__(self, name: str, workspace_dir: str, model_id: Optional[str] = None):
+    SYSTEM_PREAMBLE: ClassVar[str] = (
+        "You are {name}, an agent in a multi-agent software development system."
+    )
+
+    PROMPT_TEMPLATE: ClassVar[str] = "{task}"
+    _render_prompt: ClassVar[Callable[[Mapping[str, str]], str]] = staticmethod(
+        PROMPT_TEMPLATE.format_map
+    )
+
+    # Default model per tier; override with AGENT_MODEL_FAST/BALANCED/QUALITY
+    MODEL_TIERS: ClassVar[Dict[str, str]] = {
+        "fast": "claude-haiku-4-5-20251001",
+        "balanced": "claude-sonnet-4-5-20250929",
+        "quality": "claude-opus-4-1-20250805",
+    }
+
+    # Whether the coordinator may send this agent's tasks through the
+    # Message Batches API; agents with tools are never batched
+    BATCHABLE: ClassVar[bool] = False
+
+    # Keywords that bump a task description to a higher tier in route()
+    ROUTING_KEYWORDS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "quality": ("architecture", "design", "refactor", "debug", "security"),
+        "balanced": ("implement", "analyze", "review", "test", "explain"),
+    }
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Bind the subclass's PROMPT_TEMPLATE renderer."""
+        super().__init_subclass__(**kwargs)
+        cls._render_prompt = staticmethod(cls.PROMPT_TEMPLATE.format_map)
+
+    def __init__(
+        self,
+        name: str,
+        workspace_dir: str,
+        model_id: Optional[str] = None,
+        task_tier: Optional[Literal["fast", "balanced", "quality", "auto"]] = None
+    ):
         """
         Initialize a base agent.
 
@@ -45,6 +145,9 @@ class BaseAgent:
             name (str): Name of the agent (e.g., "PlanningAgent")
             workspace_dir (str): Directory path for agent's workspace
             model_id (str, optional): Specific model ID to use. Defaults to env var.
+            task_tier (str, optional): Model tier ("fast", "balanced" or
+                "quality"), or "auto" to route each task with route_for().
+                Ignored when model_id is given.
         """
         self.name = name
         self.workspace_dir = workspace_dir
@@ -52,21 +155,40 @@ class BaseAgent:
 
         # Set up workspace
         self.setup_workspace()
-        self.logger.info(f"Initialized {name} with workspace: {workspace_dir}")
+        self.logger.info("Initialized %s with workspace: %s", name, workspace_dir)
 
         # Configure the LLM model
-        self.model = self.configure_model(model_id)
+        self.auto_route = task_tier == "auto" and model_id is None
+        self.task_tier: Optional[str] = "fast" if self.auto_route else task_tier
+        self.model = self.configure_model(model_id, self.task_tier)
+        self._tier_models: Dict[str, "AnthropicModel"] = {}
+        if self.task_tier:
+            self._tier_models[self.task_tier] = self.model
+
+        # Initialize Strand Agent with tools (imported here so that importing
+        # this module does not load the Strands/Anthropic SDK stack)
+        from strands import Agent
 
-        # Initialize Strand Agent with tools
         self.tools = self.get_tools()
-        self.agent = Agent(model=self.model, tools=self.tools)
+        self.system_prompt = self.build_system_prompt()
+        # No callback handler: responses reach callers through invoke()'s
+        # return value or its on_token callback, never printed directly
+        self.agent = Agent(
+            model=self.model,
+            tools=self.tools,
+            system_prompt=self.system_prompt,
+            callback_handler=None
+        )
 
-    def configure_model(self, model_id: Optional[str] = None) -> AnthropicModel:
+    def configure_model(
+        self, model_id: Optional[str] = None, task_tier: Optional[str] = None
+    ) -> "AnthropicModel":
         """
         Configure the LLM model for this agent.
 
         Args:
             model_id (str, optional): Specific model ID. Uses env var if not provided.
+            task_tier (str, optional): Model tier used when no model_id is given
 
         Returns:
             AnthropicModel: Configured Anthropic model instance
@@ -75,18 +197,98 @@ class BaseAgent:
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
 
+        if not model_id and task_tier:
+            model_id = os.getenv(
+                f"AGENT_MODEL_{task_tier.upper()}", self.MODEL_TIERS[task_tier]
+            )
         model_id = model_id or os.getenv("AGENT_MODEL", "claude-haiku-4-5-20251001")
         max_tokens = int(os.getenv("MAX_TOKENS", "4096"))
         temperature = float(os.getenv("AGENT_TEMPERATURE", "0.7"))
 
-        self.logger.info(f"Configuring model: {model_id}")
+        self.logger.info("Configuring model: %s", model_id)
 
-        return AnthropicModel(
-            client_args={"api_key": api_key},
-            max_tokens=max_tokens,
-            model_id=model_id,
-            params={"temperature": temperature}
-        )
+        # Remembered for response cache keys
+        self.model_id = model_id
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+
+        return _get_model(api_key, model_id, max_tokens, temperature)
+
+    @classmethod
+    def route(cls, task_description: str) -> TaskTier:
+        """
+        Pick a model tier for a task using simple heuristics.
+
+        Uses an approximate token count (about four characters per token)
+        and the keywords in ROUTING_KEYWORDS.
+
+        Args:
+            task_description (str): The task description
+
+        Returns:
+            TaskTier: "fast", "balanced" or "quality"
+        """
+        approx_tokens = len(task_description) // 4
+        text = task_description.lower()
+
+        if approx_tokens > 2000 or any(k in text for k in cls.ROUTING_KEYWORDS["quality"]):
+            return "quality"
+        if approx_tokens > 200 or any(k in text for k in cls.ROUTING_KEYWORDS["balanced"]):
+            return "balanced"
+        return "fast"
+
+    def route_for(self, task_description: str) -> Optional[str]:
+        """
+        Switch to the model tier suited to a task.
+
+        Only agents created with task_tier="auto" are re-routed; others keep
+        their configured model. Models are built once per tier and reused.
+
+        Args:
+            task_description (str): The task about to be executed
+
+        Returns:
+            Optional[str]: The tier now in use, if any
+        """
+        if not self.auto_route:
+            return self.task_tier
+
+        tier = self.route(task_description)
+        if tier != self.task_tier:
+            model = self._tier_models.get(tier)
+            if model is None:
+                model = self._tier_models[tier] = self.configure_model(task_tier=tier)
+
+            self.model = self.agent.model = model
+            self.model_id = model.get_config()["model_id"]
+            self.task_tier = tier
+            self.logger.info("%s routed to %s tier (%s)", self.name, tier, self.model_id)
+
+        return tier
+
+    def render_prompt(self, task: str) -> str:
+        """
+        Render the per-task prompt from PROMPT_TEMPLATE.
+
+        Args:
+            task (str): The task description
+
+        Returns:
+            str: The prompt to send to the model
+        """
+        return self._render_prompt({"task": task})
+
+    def build_system_prompt(self) -> str:
+        """
+        Build the static system prompt for this agent.
+
+        Only the "{name}" placeholder is substituted, so the preamble may
+        contain literal braces (e.g. JSON or code samples).
+
+        Returns:
+            str: SYSTEM_PREAMBLE with the agent name filled in
+        """
+        return self.SYSTEM_PREAMBLE.replace("{name}", self.name)
 
     def setup_workspace(self) -> None:
         """
@@ -95,7 +297,35 @@ class BaseAgent:
         Creates the workspace directory if it doesn't exist.
         """
         os.makedirs(self.workspace_dir, exist_ok=True)
-        self.logger.debug(f"Workspace directory ready: {self.workspace_dir}")
+        self.logger.debug("Workspace directory ready: %s", self.workspace_dir)
+
+    def build_batch_request(self, description: str) -> Dict[str, Any]:
+        """
+        Build Message Batches API parameters for a task.
+
+        Batch requests are single-turn: tool calls requested by the model are
+        not executed, so only batch tasks that can be answered directly.
+        The coordinator uses this only for subclasses that set BATCHABLE.
+
+        Args:
+            description (str): The task description
+
+        Returns:
+            Dict[str, Any]: Messages API parameters for the task
+        """
+        return {
+            "model": self.model_id,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": [
+                {
+                    "type": "text",
+                    "text": self.system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            "messages": [{"role": "user", "content": self.render_prompt(description)}],
+        }
 
     def get_tools(self) -> List:
         """
@@ -114,7 +344,9 @@ class BaseAgent:
             f"{self.name} must implement get_tools() method"
         )
 
-    def execute(self, task: str) -> str:
+    def execute(
+        self, task: str, on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Execute a task using this agent.
 
@@ -123,6 +355,8 @@ class BaseAgent:
 
         Args:
             task (str): The task description or prompt for the agent
+            on_token (Callable[[str], None], optional): Called with each chunk
+                of the response as it is streamed
 
         Returns:
             str: The agent's response
@@ -134,28 +368,248 @@ class BaseAgent:
             f"{self.name} must implement execute() method"
         )
 
-    def invoke(self, message: str) -> str:
+    def invoke(
+        self, message: str, on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Invoke the agent with a message.
 
         This is a convenience method that wraps the Strand Agent's
-        invocation with logging.
+        invocation with logging. When on_token is given, the response is
+        streamed through invoke_stream() and forwarded chunk by chunk.
+
+        When the response cache is enabled and the agent has no tools,
+        responses are served from it when the same message was already sent
+        with the same model configuration and conversation history. A cache
+        hit is appended to the conversation history like a model reply.
+
+        Args:
+            message (str): The message/task for the agent
+            on_token (Callable[[str], None], optional): Called with each chunk
+                of the response as it arrives
+
+        Returns:
+            str: The agent's response
+        """
+        cache_key, cached = self._lookup_cache(message)
+        if cached is not None:
+            if on_token is not None:
+                on_token(cached)
+            return cached
+
+        if on_token is not None:
+            chunks = []
+            for chunk in self.invoke_stream(message):
+                on_token(chunk)
+                chunks.append(chunk)
+            response = "".join(chunks)
+        else:
+            self.logger.info("%s received task: %.100s...", self.name, message)
+
+            try:
+                result = self.agent(message)
+                self.logger.info("%s completed task", self.name)
+                self._log_prompt_cache_usage(result)
+                response = str(result)
+            except Exception as e:
+                self.logger.error("%s failed: %s", self.name, e)
+                raise
+
+        if cache_key is not None:
+            get_response_cache().put(cache_key, response)
+        return response
+
+    async def ainvoke(
+        self, message: str, on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Invoke the agent with a message without blocking the event loop.
+
+        Async counterpart of invoke(): awaits the Strand Agent's
+        invoke_async(), or stream_async() when on_token is given, on the
+        caller's event loop, so many agents can wait on the API at once.
 
         Args:
             message (str): The message/task for the agent
+            on_token (Callable[[str], None], optional): Called with each chunk
+                of the response as it arrives
+
+        Returns:
+            str: The agent's response
+        """
+        cache_key, cached = self._lookup_cache(message)
+        if cached is not None:
+            if on_token is not None:
+                on_token(cached)
+            return cached
+
+        self.logger.info("%s received task: %.100s...", self.name, message)
+
+        try:
+            if on_token is not None:
+                chunks = []
+                async for event in self.agent.stream_async(message):
+                    if "data" in event:
+                        on_token(event["data"])
+                        chunks.append(event["data"])
+                    elif "result" in event:
+                        self._log_prompt_cache_usage(event["result"])
+                response = "".join(chunks)
+            else:
+                result = await self.agent.invoke_async(message)
+                self._log_prompt_cache_usage(result)
+                response = str(result)
+            self.logger.info("%s completed task", self.name)
+        except Exception as e:
+            self.logger.error("%s failed: %s", self.name, e)
+            raise
+
+        if cache_key is not None:
+            get_response_cache().put(cache_key, response)
+        return response
+
+    async def aexecute(
+        self, task: str, on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Execute a task without blocking the event loop.
+
+        The default implementation runs execute() in a worker thread.
+        Subclasses should override it with an ainvoke()-based version.
+
+        Args:
+            task (str): The task description or prompt for the agent
+            on_token (Callable[[str], None], optional): Called with each chunk
+                of the response as it is streamed
 
         Returns:
             str: The agent's response
         """
-        self.logger.info(f"{self.name} received task: {message[:100]}...")
+        if on_token is not None:
+            return await asyncio.to_thread(self.execute, task, on_token)
+        return await asyncio.to_thread(self.execute, task)
+
+    def _lookup_cache(self, message: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look up a message in the shared response cache.
+
+        Args:
+            message (str): The message/task for the agent
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: The cache key (None when
+                caching is disabled or the agent has tools) and the cached
+                response, if any
+        """
+        cache = get_response_cache()
+        # A cached reply cannot replay tool calls and their side effects
+        if not cache.enabled or self.tools:
+            return None, None
+
+        cache_key = cache.make_key(
+            self.model_id, message, self.temperature, self.max_tokens,
+            self.system_prompt, self.agent.messages
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # Keep the conversation as if the model had answered
+            self.agent.messages.extend([
+                {"role": "user", "content": [{"text": message}]},
+                {"role": "assistant", "content": [{"text": cached}]},
+            ])
+            self.logger.info(
+                "%s cache hit (hits=%d, misses=%d)",
+                self.name, cache.hits, cache.misses
+            )
+        else:
+            self.logger.debug(
+                "%s cache miss (hits=%d, misses=%d)",
+                self.name, cache.hits, cache.misses
+            )
+        return cache_key, cached
+
+    def invoke_stream(self, message: str) -> Iterator[str]:
+        """
+        Invoke the agent with a message and stream the response.
+
+        Drives the Strand Agent's stream_async() on its own event loop in a
+        worker thread, like the Strand Agent's synchronous call does, and
+        yields text deltas as soon as they arrive, so callers can start
+        processing before the full completion is returned. Safe to call
+        from a thread that is already running an event loop.
+
+        Args:
+            message (str): The message/task for the agent
+
+        Yields:
+            str: Chunks of the agent's response text
+        """
+        self.logger.info("%s received task: %.100s...", self.name, message)
+
+        chunks: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        done = object()
+
+        async def pump() -> None:
+            events = self.agent.stream_async(message)
+            try:
+                async for event in events:
+                    if stop.is_set():
+                        break
+                    if "data" in event:
+                        chunks.put(event["data"])
+                    elif "result" in event:
+                        self._log_prompt_cache_usage(event["result"])
+            finally:
+                await events.aclose()
+
+        def run() -> None:
+            try:
+                asyncio.run(pump())
+            except BaseException as e:
+                chunks.put(e)
+            else:
+                chunks.put(done)
+
+        worker = threading.Thread(
+            target=run, name=f"{self.name}-stream", daemon=True
+        )
+        worker.start()
 
         try:
-            response = self.agent(message)
-            self.logger.info(f"{self.name} completed task")
-            return response
+            while True:
+                chunk = chunks.get()
+                if chunk is done:
+                    break
+                if isinstance(chunk, BaseException):
+                    raise chunk
+                yield chunk
+
+            self.logger.info("%s completed task", self.name)
         except Exception as e:
-            self.logger.error(f"{self.name} failed: {str(e)}")
+            self.logger.error("%s failed: %s", self.name, e)
             raise
+        finally:
+            # Closing the generator early stops the stream at the next event
+            stop.set()
+
+    def _log_prompt_cache_usage(self, result: Any) -> None:
+        """
+        Log Anthropic prompt cache usage reported for an invocation.
+
+        Args:
+            result (Any): The Strand AgentResult of the invocation
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        usage = result.metrics.accumulated_usage
+        self.logger.info(
+            "%s prompt cache: cache_read_input_tokens=%d, cache_creation_input_tokens=%d",
+            self.name,
+            usage.get("cacheReadInputTokens", 0),
+            usage.get("cacheWriteInputTokens", 0)
+        )
 
     def get_workspace_path(self, filename: str) -> str:
         """
@@ -0,0 +1,82 @@
+"""
+Anthropic Model with Prompt Caching
+
+This module extends the Strands Anthropic model so that the static part of
+every request (tool schemas and system prompt) is marked for Anthropic
+prompt caching, and so that cache token usage is reported back in the
+agent's metrics.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from strands.models.anthropic import AnthropicModel
+from strands.types.streaming import StreamEvent
+
+# Beta header enabling prompt caching on older API versions
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+class PromptCachingAnthropicModel(AnthropicModel):
+    """
+    Anthropic model that caches the tool and system prompt prefix.
+
+    Anthropic caches everything up to and including the block marked with
+    cache_control, in the order tools -> system -> messages. Marking the
+    system prompt therefore caches the tool schemas as well; without a
+    system prompt the last tool schema is marked instead.
+    """
+
+    def format_request(
+        self,
+        messages: List[Dict[str, Any]],
+        tool_specs: Optional[List[Dict[str, Any]]] = None,
+        system_prompt: Optional[str] = None,
+        tool_choice: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Format an Anthropic request with cache breakpoints.
+
+        Args:
+            messages: List of message objects to be processed by the model
+            tool_specs: List of tool specifications to make available to the model
+            system_prompt: System prompt to provide context to the model
+            tool_choice: Selection strategy for tool invocation
+
+        Returns:
+            Dict[str, Any]: An Anthropic streaming request
+        """
+        request = super().format_request(messages, tool_specs, system_prompt, tool_choice)
+
+        if system_prompt:
+            request["system"] = [
+                {"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL}
+            ]
+        elif request["tools"]:
+            request["tools"][-1] = {**request["tools"][-1], "cache_control": CACHE_CONTROL}
+
+        return request
+
+    def format_chunk(self, event: Dict[str, Any]) -> StreamEvent:
+        """
+        Format an Anthropic response event, keeping cache token usage.
+
+        Args:
+            event: A response event from the Anthropic model
+
+        Returns:
+            StreamEvent: The formatted chunk
+        """
+        chunk = super().format_chunk(event)
+
+        if event["type"] == "metadata":
+            usage = event["usage"]
+            chunk["metadata"]["usage"]["cacheReadInputTokens"] = (
+                usage.get("cache_read_input_tokens") or 0
+            )
+            chunk["metadata"]["usage"]["cacheWriteInputTokens"] = (
+                usage.get("cache_creation_input_tokens") or 0
+            )
+
+        return chunk
@@ -0,0 +1,159 @@
+"""
+Response Cache for Agent Invocations
+
+This module provides an in-process cache of agent responses so that
+identical prompts sent to the same model configuration and conversation
+are answered without a round-trip to the Anthropic API.
+
+The cache is disabled unless AGENT_CACHE_SIZE is set. A cached response
+replays text only, so it is only used for agents without tools, and
+sampling at a non-zero temperature means a hit may differ from what a
+fresh call would have returned.
+"""
+
+import os
+import time
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of agent responses with a time-to-live.
+
+    Entries are keyed by a SHA-256 digest of the model configuration, the
+    prompts and the conversation history, so agents sharing a model
+    configuration and conversation state share cache hits.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 3600.0):
+        """
+        Initialize the response cache.
+
+        Args:
+            max_entries (int): Maximum number of cached responses (0 disables caching)
+            ttl_seconds (float): Seconds after which an entry expires
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores any entries."""
+        return self.max_entries > 0
+
+    @staticmethod
+    def make_key(
+        model_id: str,
+        message: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str = "",
+        history: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model_id (str): Model identifier
+            message (str): Prompt sent to the model
+            temperature (float): Sampling temperature
+            max_tokens (int): Maximum tokens in the response
+            system_prompt (str): System prompt sent with the message
+            history (List[Dict[str, Any]], optional): Conversation messages
+                sent before the message
+
+        Returns:
+            str: Hex SHA-256 digest identifying the request
+        """
+        payload = json.dumps(
+            [model_id, system_prompt, history or [], message, temperature, max_tokens],
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key (str): Cache key from make_key()
+
+        Returns:
+            Optional[str]: The cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response, evicting the least recently used entries if full.
+
+        Args:
+            key (str): Cache key from make_key()
+            response (str): Response text to cache
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation of the response cache."""
+        return (
+            f"ResponseCache(entries={len(self._entries)}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+
+@lru_cache(maxsize=None)
+def get_response_cache() -> ResponseCache:
+    """
+    Get the process-wide response cache.
+
+    The cache is configured from the AGENT_CACHE_SIZE and AGENT_CACHE_TTL
+    environment variables on first use, and is disabled by default.
+
+    Returns:
+        ResponseCache: Shared response cache instance
+    """
+    return ResponseCache(
+        max_entries=int(os.getenv("AGENT_CACHE_SIZE", "0")),
+        ttl_seconds=float(os.getenv("AGENT_CACHE_TTL", "3600"))
+    )
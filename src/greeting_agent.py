@@ -1,21 +1,35 @@
 import os
 import logging
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
-from strands import Agent, tool
-from strands.models.anthropic import AnthropicModel
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
-@tool
+_GREETING_PREFIX = "Hello, "
+_GREETING_SUFFIX = "! Welcome to Strand Agents. It's great to meet you!"
+_FALLBACK_GREETING = "Hello there! What's your name?"
+
+
+@lru_cache(maxsize=1024)
+def _render(name: str) -> Optional[str]:
+    """
+    Render the greeting for a name, or None if the name is blank.
+
+    Args:
+        name (str): The raw name passed to the tool
+
+    Returns:
+        Optional[str]: The greeting message
+    """
+    stripped = name.strip()
+    return _GREETING_PREFIX + stripped + _GREETING_SUFFIX if stripped else None
+
+
 def get_greeting(name: str) -> str:
     """
     Generate a personalized greeting for the user.
@@ -26,34 +40,59 @@ def get_greeting(name: str) -> str:
     Returns:
         str: A friendly personalized greeting message
     """
-    logger.info(f"get_greeting tool called with name: {name}")
+    logger.info("get_greeting tool called with name: %s", name)
 
-    if not isinstance(name, str) or not name.strip():
+    greeting = _render(name) if isinstance(name, str) else None
+    if greeting is None:
         logger.warning("Invalid or empty name provided")
-        return "Hello there! What's your name?"
+        return _FALLBACK_GREETING
 
-    greeting = f"Hello, {name.strip()}! Welcome to Strand Agents. It's great to meet you!"
-    logger.info(f"Generated greeting: {greeting}")
+    logger.info("Generated greeting: %s", greeting)
     return greeting
 
 
-# Configure the Anthropic model
-model = AnthropicModel(
-    client_args={
-        "api_key": os.getenv("ANTHROPIC_API_KEY"),
-    },
-    max_tokens=1024,
-    model_id="claude-haiku-4-5-20251001",
-    params={
-        "temperature": 0.7,
-    }
-)
+@lru_cache(maxsize=None)
+def get_agent():
+    """
+    Create the greeting agent on first use.
+
+    Strands and the Anthropic SDK are imported here rather than at module
+    level, so importing this module does not build the model client.
+
+    Returns:
+        Agent: Strand Agent with the greeting tool
+    """
+    from strands import Agent, tool
+    from strands.models.anthropic import AnthropicModel
+
+    # Configure the Anthropic model
+    model = AnthropicModel(
+        client_args={
+            "api_key": os.getenv("ANTHROPIC_API_KEY"),
+        },
+        max_tokens=1024,
+        model_id="claude-haiku-4-5-20251001",
+        params={
+            "temperature": 0.7,
+        }
+    )
+
+    # Create the greeting agent with the custom greeting tool
+    return Agent(model=model, tools=[tool(get_greeting)])
 
-# Create the greeting agent with the custom greeting tool
-agent = Agent(model=model, tools=[get_greeting])
 
 # Execute the agent with a greeting request
 if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+
+    # Add project root to path for imports, as in demo_phase1.py
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from src.agents.base_agent import configure_logging
+
+    # Configure logging
+    configure_logging()
+
     message = "Please greet me! My name is Deb."
-    response = agent(message)
+    response = get_agent()(message)
     print(response)
@@ -5,24 +5,64 @@ This module orchestrates the workflow between multiple agents,
 managing task assignment, agent communication, and workflow execution.
 """
 
+import asyncio
+import itertools
+import json
 import logging
-from typing import Dict, List, Optional, Any
-from enum import Enum
+import operator
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any
+from enum import IntEnum
 
 from src.orchestrator.workspace import WorkspaceManager
 from src.tools.github_tools import GitHubClient
 
 logger = logging.getLogger(__name__)
 
+# Optional speedups: install with `uv sync --extra fast`
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class TaskStatus(Enum):
-    """Status of a task in the workflow."""
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
+try:
+    if sys.platform == "win32":
+        raise ImportError("uvloop does not support Windows")
+    import uvloop
+    _run_async = uvloop.run
+except ImportError:
+    _run_async = asyncio.run
 
+_get_status_fields = operator.attrgetter(
+    "task_id", "agent_name", "description", "status", "result", "error"
+)
 
+
+class TaskStatus(IntEnum):
+    """
+    Status of a task in the workflow.
+
+    Values are distinct bits, so statuses can be combined into a mask,
+    e.g. TaskStatus.PENDING | TaskStatus.IN_PROGRESS.
+    """
+    PENDING = 1
+    IN_PROGRESS = 2
+    COMPLETED = 4
+    FAILED = 8
+
+    @property
+    def label(self) -> str:
+        """Status name used in status reports (e.g. "in_progress")."""
+        return self.name.lower()
+
+
+@dataclass(slots=True, eq=False)
 class AgentTask:
     """
     Represents a task assigned to an agent.
@@ -31,30 +71,29 @@ class AgentTask:
         task_id (str): Unique task identifier
         agent_name (str): Name of the assigned agent
         description (str): Task description
+        on_token (Callable[[str], None]): Optional callback receiving
+            streamed response chunks
+        agent_id (int): Registry handle of the assigned agent
         status (TaskStatus): Current task status
         result (Any): Task result when completed
         error (str): Error message if failed
     """
 
-    def __init__(self, task_id: str, agent_name: str, description: str):
-        """
-        Initialize an agent task.
+    task_id: str
+    agent_name: str
+    description: str
+    on_token: Optional[Callable[[str], None]] = None
+    agent_id: int = -1
+    status: TaskStatus = TaskStatus.PENDING
+    result: Optional[Any] = None
+    error: Optional[str] = None
 
-        Args:
-            task_id (str): Unique task identifier
-            agent_name (str): Name of the assigned agent
-            description (str): Task description
-        """
-        self.task_id = task_id
-        self.agent_name = agent_name
-        self.description = description
-        self.status = TaskStatus.PENDING
-        self.result: Optional[Any] = None
-        self.error: Optional[str] = None
+    # Notified as (task, previous_status) after every status change
+    _on_status_change: Optional[Callable[["AgentTask", TaskStatus], None]] = None
 
     def mark_in_progress(self) -> None:
         """Mark task as in progress."""
-        self.status = TaskStatus.IN_PROGRESS
+        self._set_status(TaskStatus.IN_PROGRESS)
 
     def mark_completed(self, result: Any) -> None:
         """
@@ -63,8 +102,8 @@ class AgentTask:
         Args:
             result (Any): The task result
         """
-        self.status = TaskStatus.COMPLETED
         self.result = result
+        self._set_status(TaskStatus.COMPLETED)
 
     def mark_failed(self, error: str) -> None:
         """
@@ -73,11 +112,62 @@ class AgentTask:
         Args:
             error (str): Error message
         """
-        self.status = TaskStatus.FAILED
         self.error = error
+        self._set_status(TaskStatus.FAILED)
+
+    def _set_status(self, status: TaskStatus) -> None:
+        """
+        Change the task status and notify the status listener.
+
+        Args:
+            status (TaskStatus): The new status
+        """
+        previous = self.status
+        self.status = status
+        if self._on_status_change is not None:
+            self._on_status_change(self, previous)
 
     def __repr__(self) -> str:
-        return f"AgentTask({self.task_id}, {self.agent_name}, {self.status.value})"
+        return f"AgentTask({self.task_id}, {self.agent_name}, {self.status.label})"
+
+
+def _task_status(task: AgentTask) -> Dict[str, Any]:
+    """
+    Build the status report of a task.
+
+    Args:
+        task (AgentTask): The task
+
+    Returns:
+        Dict[str, Any]: Task status information
+    """
+    task_id, agent_name, description, status, result, error = _get_status_fields(task)
+    return {
+        "task_id": task_id,
+        "agent_name": agent_name,
+        "description": description,
+        "status": status.label,
+        "result": result,
+        "error": error
+    }
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize status data to JSON, using orjson when available.
+
+    Values that are not natively serializable (e.g. agent results) are
+    converted with str().
+
+    Args:
+        obj (Any): Data to serialize
+
+    Returns:
+        str: JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
 
 
 class AgentCoordinator:
@@ -108,12 +198,22 @@ class AgentCoordinator:
         self.github_client = github_client
         self.logger = logging.getLogger(f"{__name__}.AgentCoordinator")
 
-        # Agent registry
+        # Agent registry; tasks dispatch through integer handles into
+        # _agent_by_id, which keeps a None slot for unregistered agents
         self.agents: Dict[str, Any] = {}
+        self._agent_by_id: List[Any] = []
+        self._agent_ids: Dict[str, int] = {}
 
         # Task tracking
         self.tasks: Dict[str, AgentTask] = {}
-        self.task_counter = 0
+        self._task_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+        # Task IDs per status (dicts used as insertion-ordered sets)
+        self._status_index: Dict[TaskStatus, Dict[str, None]] = {
+            status: {} for status in TaskStatus
+        }
+        self._anthropic_client = None
 
         self.logger.info("Agent coordinator initialized")
 
@@ -126,7 +226,15 @@ class AgentCoordinator:
             agent_instance (Any): The agent instance
         """
         self.agents[agent_name] = agent_instance
-        self.logger.info(f"Registered agent: {agent_name}")
+
+        agent_id = self._agent_ids.get(agent_name)
+        if agent_id is None:
+            self._agent_ids[agent_name] = len(self._agent_by_id)
+            self._agent_by_id.append(agent_instance)
+        else:
+            self._agent_by_id[agent_id] = agent_instance
+
+        self.logger.info("Registered agent: %s", agent_name)
 
     def unregister_agent(self, agent_name: str) -> None:
         """
@@ -137,15 +245,24 @@ class AgentCoordinator:
         """
         if agent_name in self.agents:
             del self.agents[agent_name]
-            self.logger.info(f"Unregistered agent: {agent_name}")
+            self._agent_by_id[self._agent_ids[agent_name]] = None
+            self.logger.info("Unregistered agent: %s", agent_name)
 
-    def create_task(self, agent_name: str, description: str) -> str:
+    def create_task(
+        self,
+        agent_name: str,
+        description: str,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Create a new task for an agent.
 
         Args:
             agent_name (str): Name of the agent to assign the task
             description (str): Task description
+            on_token (Callable[[str], None], optional): Callback receiving
+                partial results while the task streams; the agent's
+                execute() must accept an on_token argument
 
         Returns:
             str: Task ID
@@ -156,13 +273,18 @@ class AgentCoordinator:
         if agent_name not in self.agents:
             raise ValueError(f"Agent '{agent_name}' is not registered")
 
-        self.task_counter += 1
-        task_id = f"task_{self.task_counter:04d}"
+        task_id = "task_" + str(next(self._task_ids)).zfill(4)
+        task = AgentTask(
+            task_id, agent_name, description, on_token,
+            agent_id=self._agent_ids[agent_name]
+        )
+        task._on_status_change = self._reindex_task
 
-        task = AgentTask(task_id, agent_name, description)
-        self.tasks[task_id] = task
+        with self._lock:
+            self.tasks[task_id] = task
+            self._status_index[TaskStatus.PENDING][task_id] = None
 
-        self.logger.info(f"Created {task}")
+        self.logger.info("Created %r", task)
         return task_id
 
     def execute_task(self, task_id: str) -> Any:
@@ -179,25 +301,123 @@ class AgentCoordinator:
             ValueError: If task doesn't exist
             RuntimeError: If agent execution fails
         """
-        if task_id not in self.tasks:
-            raise ValueError(f"Task '{task_id}' not found")
+        task = self._start_task(task_id)
 
-        task = self.tasks[task_id]
-        task.mark_in_progress()
+        try:
+            agent = self._prepare_agent(task)
+            result = agent.execute(task.description, **self._execute_kwargs(task))
+            task.mark_completed(result)
+            self.logger.info("Completed %r", task)
+            return result
+        except Exception as e:
+            raise self._fail_task(task, e) from e
+
+    async def execute_task_async(self, task_id: str) -> Any:
+        """
+        Execute a task without blocking the event loop.
+
+        Agents providing aexecute() are awaited directly; others run their
+        synchronous execute() in a worker thread.
+
+        Args:
+            task_id (str): Task ID to execute
+
+        Returns:
+            Any: Task result
 
-        self.logger.info(f"Executing {task}")
+        Raises:
+            ValueError: If task doesn't exist
+            RuntimeError: If agent execution fails
+        """
+        task = self._start_task(task_id)
 
         try:
-            agent = self.agents[task.agent_name]
-            result = agent.execute(task.description)
+            agent = self._prepare_agent(task)
+            kwargs = self._execute_kwargs(task)
+            if hasattr(agent, "aexecute"):
+                result = await agent.aexecute(task.description, **kwargs)
+            else:
+                result = await asyncio.to_thread(agent.execute, task.description, **kwargs)
             task.mark_completed(result)
-            self.logger.info(f"Completed {task}")
+            self.logger.info("Completed %r", task)
             return result
+        except asyncio.CancelledError:
+            task.mark_failed("Task execution cancelled")
+            self.logger.warning("Cancelled %r", task)
+            raise
         except Exception as e:
-            error_msg = f"Task execution failed: {str(e)}"
-            task.mark_failed(error_msg)
-            self.logger.error(f"Failed {task}: {error_msg}")
-            raise RuntimeError(error_msg) from e
+            raise self._fail_task(task, e) from e
+
+    def _start_task(self, task_id: str) -> AgentTask:
+        """
+        Look up a task and mark it as in progress.
+
+        Args:
+            task_id (str): Task ID to execute
+
+        Returns:
+            AgentTask: The started task
+
+        Raises:
+            ValueError: If task doesn't exist
+        """
+        if task_id not in self.tasks:
+            raise ValueError(f"Task '{task_id}' not found")
+
+        task = self.tasks[task_id]
+        task.mark_in_progress()
+
+        self.logger.info("Executing %r", task)
+        return task
+
+    def _prepare_agent(self, task: AgentTask) -> Any:
+        """
+        Get the agent for a task, letting it pick a model tier first.
+
+        Args:
+            task (AgentTask): The task about to be executed
+
+        Returns:
+            Any: The agent instance
+
+        Raises:
+            ValueError: If the agent has been unregistered
+        """
+        agent = self._agent_by_id[task.agent_id]
+        if agent is None:
+            raise ValueError(f"Agent '{task.agent_name}' is not registered")
+        if hasattr(agent, "route_for"):
+            agent.route_for(task.description)
+        return agent
+
+    @staticmethod
+    def _execute_kwargs(task: AgentTask) -> Dict[str, Any]:
+        """
+        Build the optional keyword arguments passed to an agent's execute().
+
+        Args:
+            task (AgentTask): The task about to be executed
+
+        Returns:
+            Dict[str, Any]: on_token when the task streams, otherwise empty
+        """
+        return {"on_token": task.on_token} if task.on_token is not None else {}
+
+    def _fail_task(self, task: AgentTask, error: Exception) -> RuntimeError:
+        """
+        Mark a task as failed.
+
+        Args:
+            task (AgentTask): The failed task
+            error (Exception): The exception raised by the agent
+
+        Returns:
+            RuntimeError: Error to raise to the caller
+        """
+        error_msg = f"Task execution failed: {str(error)}"
+        task.mark_failed(error_msg)
+        self.logger.error("Failed %r: %s", task, error_msg)
+        return RuntimeError(error_msg)
 
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
@@ -215,23 +435,38 @@ class AgentCoordinator:
         if task_id not in self.tasks:
             raise ValueError(f"Task '{task_id}' not found")
 
-        task = self.tasks[task_id]
-        return {
-            "task_id": task.task_id,
-            "agent_name": task.agent_name,
-            "description": task.description,
-            "status": task.status.value,
-            "result": task.result,
-            "error": task.error
-        }
+        return _task_status(self.tasks[task_id])
+
+    def get_all_task_statuses(self) -> List[Dict[str, Any]]:
+        """
+        Get the status of every task in a single pass.
 
-    def execute_workflow(self, workflow_steps: List[Dict[str, str]]) -> List[Any]:
+        Returns:
+            List[Dict[str, Any]]: Task status information, in creation order
+        """
+        with self._lock:
+            tasks = list(self.tasks.values())
+        return [_task_status(task) for task in tasks]
+
+    def execute_workflow(
+        self,
+        workflow_steps: List[Dict[str, Any]],
+        dependencies: Optional[Dict[int, List[int]]] = None
+    ) -> List[Any]:
         """
         Execute a multi-step workflow across agents.
 
+        This is a synchronous wrapper around execute_workflow_async(),
+        run on a uvloop event loop when uvloop is installed. When called
+        from a thread that is already running an event loop, the workflow
+        runs on a fresh loop in a worker thread and this call blocks until
+        it finishes; async callers should await execute_workflow_async().
+
         Args:
-            workflow_steps (List[Dict[str, str]]): List of workflow steps,
+            workflow_steps (List[Dict[str, Any]]): List of workflow steps,
                 each containing 'agent_name' and 'description'
+            dependencies (Dict[int, List[int]], optional): Extra step
+                dependencies, see execute_workflow_async()
 
         Returns:
             List[Any]: Results from each step
@@ -244,22 +479,299 @@ class AgentCoordinator:
             ]
             results = coordinator.execute_workflow(steps)
         """
-        results = []
+        def run() -> List[Any]:
+            return _run_async(
+                self.execute_workflow_async(workflow_steps, dependencies)
+            )
 
-        self.logger.info(f"Executing workflow with {len(workflow_steps)} steps")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run()
 
-        for i, step in enumerate(workflow_steps, 1):
-            agent_name = step["agent_name"]
-            description = step["description"]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(run).result()
+
+    async def execute_workflow_async(
+        self,
+        workflow_steps: List[Dict[str, Any]],
+        dependencies: Optional[Dict[int, List[int]]] = None,
+        max_parallel: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Execute a multi-step workflow, running independent steps concurrently.
+
+        Each step may carry a 'depends_on' list of (0-based) step indices it
+        must wait for. A step without 'depends_on' waits for the previous
+        step, so plain step lists keep their sequential behaviour; use
+        'depends_on': [] to mark a step as independent. Steps assigned to
+        the same agent never run at the same time, since an agent holds a
+        single conversation. Steps are awaited with execute_task_async(),
+        so agents with an aexecute() method need no worker thread. If a
+        step fails, steps that have not started are skipped and running
+        steps are allowed to finish before the error is raised.
+
+        Args:
+            workflow_steps (List[Dict[str, Any]]): List of workflow steps,
+                each containing 'agent_name', 'description' and optionally
+                'depends_on' and 'on_token'
+            dependencies (Dict[int, List[int]], optional): Additional
+                dependencies, mapping a step index to the indices it waits for
+            max_parallel (int, optional): Maximum number of steps running at
+                once. Defaults to the MAX_PARALLEL_TASKS env var.
+
+        Returns:
+            List[Any]: Results from each step, in step order
+
+        Raises:
+            ValueError: If the dependencies are invalid or cyclic
+            RuntimeError: If a step fails
 
-            self.logger.info(f"Step {i}/{len(workflow_steps)}: {agent_name}")
+        Example:
+            steps = [
+                {"agent_name": "planning", "description": "Analyze problem"},
+                {"agent_name": "coding", "description": "Module A", "depends_on": [0]},
+                {"agent_name": "docs", "description": "Module B", "depends_on": [0]}
+            ]
+            results = await coordinator.execute_workflow_async(steps)
+        """
+        prerequisites = self._resolve_dependencies(workflow_steps, dependencies)
+        max_parallel = max_parallel or int(os.getenv("MAX_PARALLEL_TASKS", "4"))
+        semaphore = asyncio.Semaphore(max_parallel)
+        agent_locks = {
+            step["agent_name"]: asyncio.Lock() for step in workflow_steps
+        }
+        total = len(workflow_steps)
 
-            task_id = self.create_task(agent_name, description)
-            result = self.execute_task(task_id)
-            results.append(result)
+        self.logger.info(
+            "Executing workflow with %d steps (max_parallel=%d)", total, max_parallel
+        )
+
+        started = set()
+
+        async def run_step(index: int, step: Dict[str, Any]) -> Any:
+            if prerequisites[index]:
+                # Unlike gather(), wait() leaves the prerequisites running
+                # when this step is cancelled
+                deps = [runs[i] for i in prerequisites[index]]
+                await asyncio.wait(deps, return_when=asyncio.FIRST_EXCEPTION)
+                for dep in deps:
+                    if dep.done():
+                        dep.result()
+
+            agent_name = step["agent_name"]
+            async with agent_locks[agent_name], semaphore:
+                started.add(index)
+                self.logger.info("Step %d/%d: %s", index + 1, total, agent_name)
+                task_id = self.create_task(
+                    agent_name, step["description"], step.get("on_token")
+                )
+                return await self.execute_task_async(task_id)
+
+        runs = [
+            asyncio.ensure_future(run_step(i, step))
+            for i, step in enumerate(workflow_steps)
+        ]
+
+        try:
+            results = await asyncio.gather(*runs)
+        except asyncio.CancelledError:
+            for run in runs:
+                run.cancel()
+            raise
+        except Exception:
+            # Drop steps that have not started, but let running steps finish
+            # so that their tasks end up completed or failed
+            for index, run in enumerate(runs):
+                if index not in started:
+                    run.cancel()
+            await asyncio.gather(*runs, return_exceptions=True)
+            raise
 
         self.logger.info("Workflow completed successfully")
-        return results
+        return list(results)
+
+    def execute_workflow_batch(
+        self,
+        workflow_steps: List[Dict[str, Any]],
+        poll_interval: float = 30.0
+    ) -> List[Any]:
+        """
+        Execute independent workflow steps through the Message Batches API.
+
+        All steps are submitted as one Anthropic message batch, which is
+        processed asynchronously server-side at a reduced price. Every
+        step's agent must support batching (see _supports_batch());
+        otherwise the workflow falls back to execute_workflow(). Steps must
+        not depend on each other, and batch requests are single-turn.
+
+        Args:
+            workflow_steps (List[Dict[str, Any]]): List of workflow steps,
+                each containing 'agent_name' and 'description'
+            poll_interval (float): Seconds between batch status checks
+
+        Returns:
+            List[Any]: Results from each step, in step order
+
+        Raises:
+            ValueError: If an agent is not registered
+            RuntimeError: If any step of the batch fails
+        """
+        for step in workflow_steps:
+            if not self._supports_batch(self.agents.get(step["agent_name"])):
+                self.logger.info(
+                    "Agent '%s' does not support batching, executing workflow directly",
+                    step["agent_name"]
+                )
+                return self.execute_workflow(workflow_steps)
+
+        params = [
+            self.agents[step["agent_name"]].build_batch_request(step["description"])
+            for step in workflow_steps
+        ]
+        task_ids = [
+            self.create_task(step["agent_name"], step["description"])
+            for step in workflow_steps
+        ]
+        requests = [
+            {"custom_id": task_id, "params": step_params}
+            for task_id, step_params in zip(task_ids, params)
+        ]
+
+        client = self._get_anthropic_client()
+        try:
+            batch = client.messages.batches.create(requests=requests)
+        except Exception as e:
+            error_msg = f"Batch submission failed: {str(e)}"
+            for task_id in task_ids:
+                self.tasks[task_id].mark_failed(error_msg)
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        for task_id in task_ids:
+            self.tasks[task_id].mark_in_progress()
+        self.logger.info("Submitted batch %s with %d requests", batch.id, len(requests))
+
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        for entry in client.messages.batches.results(batch.id):
+            task = self.tasks[entry.custom_id]
+            if entry.result.type == "succeeded":
+                task.mark_completed("".join(
+                    block.text for block in entry.result.message.content
+                    if block.type == "text"
+                ))
+            elif entry.result.type == "errored":
+                task.mark_failed(f"Batch request errored: {entry.result.error}")
+            else:
+                task.mark_failed(f"Batch request {entry.result.type}")
+
+        failed = [
+            task_id for task_id in task_ids
+            if self.tasks[task_id].status != TaskStatus.COMPLETED
+        ]
+        if failed:
+            error_msg = f"Batch {batch.id} failed for tasks: {', '.join(failed)}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        self.logger.info("Batch %s completed successfully", batch.id)
+        return [self.tasks[task_id].result for task_id in task_ids]
+
+    @staticmethod
+    def _supports_batch(agent: Any) -> bool:
+        """
+        Check whether an agent's tasks can be sent through the Batches API.
+
+        Batch requests are single-turn and cannot run tools, so an agent
+        qualifies only if it provides build_batch_request(), has not opted
+        out via BATCHABLE = False, and has no tools.
+
+        Args:
+            agent (Any): Registered agent instance (or None)
+
+        Returns:
+            bool: True if the agent's tasks may be batched
+        """
+        return (
+            callable(getattr(agent, "build_batch_request", None))
+            and getattr(agent, "BATCHABLE", True)
+            and not getattr(agent, "tools", None)
+        )
+
+    def _get_anthropic_client(self) -> Any:
+        """
+        Get the Anthropic client used for message batches, creating it on first use.
+
+        Returns:
+            anthropic.Anthropic: Anthropic API client
+        """
+        if self._anthropic_client is None:
+            import anthropic
+
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+            if not api_key:
+                raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
+            self._anthropic_client = anthropic.Anthropic(api_key=api_key)
+
+        return self._anthropic_client
+
+    @staticmethod
+    def _resolve_dependencies(
+        workflow_steps: List[Dict[str, Any]],
+        dependencies: Optional[Dict[int, List[int]]] = None
+    ) -> List[List[int]]:
+        """
+        Build the prerequisite list of every workflow step.
+
+        Args:
+            workflow_steps (List[Dict[str, Any]]): List of workflow steps
+            dependencies (Dict[int, List[int]], optional): Additional dependencies
+
+        Returns:
+            List[List[int]]: Prerequisite step indices for each step
+
+        Raises:
+            ValueError: If a dependency is out of range or the graph has a cycle
+        """
+        total = len(workflow_steps)
+        prerequisites = []
+
+        for i, step in enumerate(workflow_steps):
+            if "depends_on" in step:
+                deps = set(step["depends_on"])
+            else:
+                deps = {i - 1} if i > 0 else set()
+            deps.update((dependencies or {}).get(i, []))
+
+            for dep in deps:
+                if not 0 <= dep < total or dep == i:
+                    raise ValueError(f"Step {i} has invalid dependency: {dep}")
+            prerequisites.append(sorted(deps))
+
+        # Kahn's algorithm: every step must be reachable in topological order
+        remaining = [len(deps) for deps in prerequisites]
+        dependents: List[List[int]] = [[] for _ in range(total)]
+        for i, deps in enumerate(prerequisites):
+            for dep in deps:
+                dependents[dep].append(i)
+
+        ready = [i for i in range(total) if remaining[i] == 0]
+        visited = 0
+        while ready:
+            node = ready.pop()
+            visited += 1
+            for child in dependents[node]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+
+        if visited != total:
+            raise ValueError("Workflow dependencies contain a cycle")
+
+        return prerequisites
 
     def get_pending_tasks(self, agent_name: Optional[str] = None) -> List[AgentTask]:
         """
@@ -271,16 +783,36 @@ class AgentCoordinator:
         Returns:
             List[AgentTask]: List of pending tasks
         """
-        tasks = [
-            task for task in self.tasks.values()
-            if task.status == TaskStatus.PENDING
-        ]
+        with self._lock:
+            tasks = [
+                self.tasks[task_id]
+                for task_id in self._status_index[TaskStatus.PENDING]
+            ]
 
         if agent_name:
             tasks = [task for task in tasks if task.agent_name == agent_name]
 
         return tasks
 
+    def get_tasks_with_mask(self, mask: int) -> List[AgentTask]:
+        """
+        Get all tasks whose status is included in a status bitmask.
+
+        Args:
+            mask (int): Bitwise OR of TaskStatus values,
+                e.g. TaskStatus.PENDING | TaskStatus.IN_PROGRESS
+
+        Returns:
+            List[AgentTask]: Matching tasks, grouped by status
+        """
+        with self._lock:
+            return [
+                self.tasks[task_id]
+                for status, task_ids in self._status_index.items()
+                if status & mask
+                for task_id in task_ids
+            ]
+
     def get_agent_tasks(self, agent_name: str) -> List[AgentTask]:
         """
         Get all tasks for a specific agent.
@@ -305,10 +837,8 @@ class AgentCoordinator:
         """
         total_tasks = len(self.tasks)
         status_counts = {
-            "pending": sum(1 for t in self.tasks.values() if t.status == TaskStatus.PENDING),
-            "in_progress": sum(1 for t in self.tasks.values() if t.status == TaskStatus.IN_PROGRESS),
-            "completed": sum(1 for t in self.tasks.values() if t.status == TaskStatus.COMPLETED),
-            "failed": sum(1 for t in self.tasks.values() if t.status == TaskStatus.FAILED)
+            status.label: len(task_ids)
+            for status, task_ids in self._status_index.items()
         }
 
         return {
@@ -317,10 +847,45 @@ class AgentCoordinator:
             "status_counts": status_counts
         }
 
+    def _reindex_task(self, task: AgentTask, previous: TaskStatus) -> None:
+        """
+        Move a task between status index buckets after a status change.
+
+        Args:
+            task (AgentTask): The task whose status changed
+            previous (TaskStatus): The task's previous status
+        """
+        with self._lock:
+            if task.task_id not in self.tasks:
+                return
+            self._status_index[previous].pop(task.task_id, None)
+            self._status_index[task.status][task.task_id] = None
+
+    def get_workflow_summary_json(self) -> str:
+        """
+        Get the workflow summary as a JSON document.
+
+        Returns:
+            str: JSON-encoded get_workflow_summary()
+        """
+        return _dumps(self.get_workflow_summary())
+
+    def get_all_task_statuses_json(self) -> str:
+        """
+        Get the status of every task as a JSON document.
+
+        Returns:
+            str: JSON-encoded get_all_task_statuses()
+        """
+        return _dumps(self.get_all_task_statuses())
+
     def reset(self) -> None:
         """Reset the coordinator state, clearing all tasks."""
-        self.tasks.clear()
-        self.task_counter = 0
+        with self._lock:
+            self.tasks.clear()
+            for task_ids in self._status_index.values():
+                task_ids.clear()
+            self._task_ids = itertools.count(1)
         self.logger.info("Coordinator reset")
 
     def __repr__(self) -> str:
@@ -6,12 +6,199 @@ for file operations within agent workspaces.
 """
 
 import os
+import re
 import shutil
+import fnmatch
 import logging
-from typing import Optional, List
-from pathlib import Path
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, List, Set, Tuple
 
 logger = logging.getLogger(__name__)
+_WM_LOGGER = logging.getLogger(f"{__name__}.WorkspaceManager")
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+# Cleared workspaces unlink their files relative to an open directory fd
+_DIR_FD_SUPPORTED = os.unlink in os.supports_dir_fd
+_DIR_OPEN_FLAGS = (
+    getattr(os, "O_PATH", os.O_RDONLY)
+    | getattr(os, "O_DIRECTORY", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+
+
+def _iter_entries(path: str, prefix: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Recursively yield all non-directory entries below a directory.
+
+    Uses os.scandir so that file types (and, on many platforms, stat
+    results) come from the directory listing itself. Symlinked
+    directories are not followed. A directory that no longer exists
+    yields nothing.
+
+    Args:
+        path (str): Directory to scan
+        prefix (str): Relative path of the directory, prepended to names
+
+    Yields:
+        Tuple[str, os.DirEntry]: Relative path and directory entry
+    """
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_entries(entry.path, prefix + entry.name + os.sep)
+            else:
+                yield prefix + entry.name, entry
+
+
+def _split_literal_prefix(pattern: str) -> Tuple[str, List[str]]:
+    """
+    Split a glob pattern into a literal directory prefix and the rest.
+
+    Empty and "." segments are dropped, so "./src/*.py" is the same
+    pattern as "src/*.py". A pattern without a directory part matches
+    names at any depth, like Path.rglob, and gets no prefix.
+
+    Args:
+        pattern (str): Glob pattern using "/" (or os.sep) as separator
+
+    Returns:
+        Tuple[str, List[str]]: Literal directory prefix (possibly empty) and
+            the remaining pattern segments
+    """
+    if os.sep != "/":
+        pattern = pattern.replace(os.sep, "/")
+    segments = [segment for segment in pattern.split("/") if segment not in ("", ".")]
+    if len(segments) <= 1:
+        return "", ["**"] + segments
+
+    literal = 0
+    # The final segment is always matched, so a fully literal pattern
+    # still checks that the entry exists
+    while literal < len(segments) - 1 and not _WILDCARD_CHARS & set(segments[literal]):
+        literal += 1
+
+    return os.path.join("", *segments[:literal]), segments[literal:]
+
+
+def _iter_matches(
+    path: str, segments: List[Tuple[str, Optional[re.Pattern]]], prefix: str = ""
+) -> Iterator[str]:
+    """
+    Recursively yield entries below a directory that match pattern segments.
+
+    Args:
+        path (str): Directory to scan
+        segments (List[Tuple[str, Optional[re.Pattern]]]): Remaining pattern
+            segments with their compiled regex ("**" segments have None)
+        prefix (str): Relative path of the directory, prepended to names
+
+    Yields:
+        str: Relative paths of matching files and directories
+    """
+    segment, regex = segments[0]
+    rest = segments[1:]
+
+    try:
+        entries = list(os.scandir(path))
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    if regex is None:
+        # "**" matches this directory and every directory below it
+        if rest:
+            yield from _iter_matches(path, rest, prefix)
+        elif prefix:
+            yield prefix.rstrip(os.sep)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_matches(entry.path, segments, prefix + entry.name + os.sep)
+        return
+
+    for entry in entries:
+        if not regex.match(entry.name):
+            continue
+        if not rest:
+            yield prefix + entry.name
+        elif entry.is_dir():
+            yield from _iter_matches(entry.path, rest, prefix + entry.name + os.sep)
+
+
+def _normalize_newlines(text: str) -> str:
+    """
+    Translate CRLF and lone CR line endings to LF.
+
+    This is the universal-newlines translation text-mode open() applies
+    when reading.
+
+    Args:
+        text (str): Decoded file contents
+
+    Returns:
+        str: Contents with LF line endings
+    """
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _fast_rmtree(path: str, max_workers: int = 8) -> None:
+    """
+    Remove a directory tree, unlinking the files of each directory in parallel.
+
+    Files are unlinked relative to an open descriptor of their directory
+    by a thread pool, so the kernel can overlap the removals. Falls back
+    to shutil.rmtree where dir_fd-relative unlinking is unsupported.
+
+    Args:
+        path (str): Directory to remove
+        max_workers (int): Maximum number of concurrent unlinks
+    """
+    if not _DIR_FD_SUPPORTED:
+        shutil.rmtree(path)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        _rmtree_with(executor, path)
+
+
+def _rmtree_with(executor: ThreadPoolExecutor, path: str) -> None:
+    """
+    Remove a directory tree using an existing thread pool.
+
+    Args:
+        executor (ThreadPoolExecutor): Pool used for unlinking files
+        path (str): Directory to remove
+    """
+    names = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _rmtree_with(executor, entry.path)
+            else:
+                names.append(entry.name)
+
+    dir_fd = os.open(path, _DIR_OPEN_FLAGS)
+    try:
+        # Consume the results so that unlink errors are raised here
+        list(executor.map(lambda name: os.unlink(name, dir_fd=dir_fd), names))
+    finally:
+        os.close(dir_fd)
+    os.rmdir(path)
 
 
 class WorkspaceManager:
@@ -23,26 +210,57 @@ class WorkspaceManager:
     - Safe file operations within workspaces
     - Workspace isolation between agents
     - Path validation and sanitization
+    - In-memory LRU caching of file contents, validated against the file's
+      modification time and size
     """
 
-    def __init__(self, base_workspace_dir: str = "./workspace"):
+    __slots__ = (
+        "base_dir",
+        "logger",
+        "_content_cache",
+        "_content_cache_bytes",
+        "_content_cache_limit",
+        "_cache_lock",
+        "_created",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        base_workspace_dir: str = "./workspace",
+        content_cache_bytes: int = 64 * 1024 * 1024
+    ):
         """
         Initialize the workspace manager.
 
         Args:
             base_workspace_dir (str): Base directory for all agent workspaces
+            content_cache_bytes (int): Maximum total size of cached file
+                contents in bytes (0 disables the cache)
         """
         self.base_dir = os.path.abspath(base_workspace_dir)
-        self.logger = logging.getLogger(f"{__name__}.WorkspaceManager")
+        self.logger = _WM_LOGGER
+
+        # file path -> (mtime_ns, size, content), least recently used first
+        self._content_cache: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._content_cache_bytes = 0
+        self._content_cache_limit = content_cache_bytes
+        self._cache_lock = threading.Lock()
+
+        # Agent workspace directories already created by this manager
+        self._created: Set[str] = set()
 
         # Create base workspace directory
         os.makedirs(self.base_dir, exist_ok=True)
-        self.logger.info(f"Workspace manager initialized at: {self.base_dir}")
+        self.logger.info("Workspace manager initialized at: %s", self.base_dir)
 
     def get_agent_workspace(self, agent_name: str) -> str:
         """
         Get the workspace directory path for a specific agent.
 
+        The directory is created on first use; later calls return the
+        cached path without touching the filesystem.
+
         Args:
             agent_name (str): Name of the agent (e.g., "planning", "coding")
 
@@ -50,7 +268,11 @@ class WorkspaceManager:
             str: Full path to the agent's workspace directory
         """
         agent_dir = os.path.join(self.base_dir, agent_name.lower())
+        if agent_dir in self._created:
+            return agent_dir
+
         os.makedirs(agent_dir, exist_ok=True)
+        self._created.add(agent_dir)
         return agent_dir
 
     def create_workspace(self, agent_name: str, clean: bool = False) -> str:
@@ -67,11 +289,10 @@ class WorkspaceManager:
         workspace_path = self.get_agent_workspace(agent_name)
 
         if clean and os.path.exists(workspace_path):
-            self.logger.warning(f"Cleaning workspace: {workspace_path}")
-            shutil.rmtree(workspace_path)
-            os.makedirs(workspace_path)
+            self.logger.warning("Cleaning workspace: %s", workspace_path)
+            self._replace_workspace(agent_name, workspace_path)
 
-        self.logger.info(f"Workspace ready for {agent_name}: {workspace_path}")
+        self.logger.info("Workspace ready for %s: %s", agent_name, workspace_path)
         return workspace_path
 
     def write_file(self, agent_name: str, filename: str, content: str) -> str:
@@ -90,13 +311,56 @@ class WorkspaceManager:
         file_path = os.path.join(workspace_path, filename)
 
         # Create subdirectories if needed
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # Encode once and write the bytes directly, bypassing TextIOWrapper
+        data = memoryview(content.encode('utf-8'))
+        try:
+            fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+        except FileNotFoundError:
+            # The workspace was removed externally since it was created
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            st = os.fstat(fd)
+        finally:
+            os.close(fd)
+
+        # Cache what read_file() would return for these bytes
+        self._cache_put(file_path, st, _normalize_newlines(content))
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Wrote file: %s", file_path)
+        return file_path
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+    def write_files(
+        self,
+        agent_name: str,
+        items: List[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> List[str]:
+        """
+        Write several files to an agent's workspace concurrently.
 
-        self.logger.debug(f"Wrote file: {file_path}")
-        return file_path
+        Args:
+            agent_name (str): Name of the agent
+            items (List[Tuple[str, str]]): (filename, content) pairs to write
+            max_workers (int): Maximum number of concurrent writes
+
+        Returns:
+            List[str]: Full paths of the written files, in the order given
+        """
+        if len(items) <= 1:
+            return [self.write_file(agent_name, name, content) for name, content in items]
+
+        workers = min(max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda item: self.write_file(agent_name, *item), items
+            ))
 
     def read_file(self, agent_name: str, filename: str) -> str:
         """
@@ -115,19 +379,46 @@ class WorkspaceManager:
         workspace_path = self.get_agent_workspace(agent_name)
         file_path = os.path.join(workspace_path, filename)
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        self.logger.debug(f"Read file: {file_path}")
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        cached = self._cache_get(file_path, st)
+        if cached is not None:
+            return cached
+
+        # Read the whole file in one go (sized by fstat) and decode once
+        fd = os.open(file_path, _READ_FLAGS)
+        try:
+            st = os.fstat(fd)
+            chunks = []
+            remaining = st.st_size
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+        finally:
+            os.close(fd)
+
+        content = _normalize_newlines(b"".join(chunks).decode('utf-8'))
+
+        self._cache_put(file_path, st, content)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Read file: %s", file_path)
         return content
 
     def list_files(self, agent_name: str, pattern: Optional[str] = None) -> List[str]:
         """
         List files in an agent's workspace.
 
+        A pattern without a directory part (e.g. "*.py") matches at any
+        depth. A pattern with directories (e.g. "src/**/*.py") is matched
+        from the workspace root, and only its leading literal directories
+        are scanned.
+
         Args:
             agent_name (str): Name of the agent
             pattern (str, optional): Glob pattern to filter files (e.g., "*.py")
@@ -136,15 +427,22 @@ class WorkspaceManager:
             List[str]: List of file paths relative to workspace
         """
         workspace_path = self.get_agent_workspace(agent_name)
-        workspace = Path(workspace_path)
 
         if pattern:
-            files = [str(p.relative_to(workspace)) for p in workspace.rglob(pattern)]
+            glob_prefix, remainder = _split_literal_prefix(pattern)
+            segments = [
+                (segment, None if segment == "**" else re.compile(fnmatch.translate(segment)))
+                for segment in remainder
+            ]
+            start = os.path.join(workspace_path, glob_prefix)
+            prefix = os.path.join(glob_prefix, "") if glob_prefix else ""
+            # "**" segments can reach the same entry more than once
+            files = set(_iter_matches(start, segments, prefix))
         else:
             files = [
-                str(p.relative_to(workspace))
-                for p in workspace.rglob("*")
-                if p.is_file()
+                rel_path
+                for rel_path, entry in _iter_entries(workspace_path)
+                if entry.is_file()
             ]
 
         return sorted(files)
@@ -163,11 +461,12 @@ class WorkspaceManager:
         workspace_path = self.get_agent_workspace(agent_name)
         file_path = os.path.join(workspace_path, filename)
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        os.remove(file_path)
-        self.logger.info(f"Deleted file: {file_path}")
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        self._cache_pop(file_path)
+        self.logger.info("Deleted file: %s", file_path)
 
     def clear_workspace(self, agent_name: str) -> None:
         """
@@ -179,9 +478,8 @@ class WorkspaceManager:
         workspace_path = self.get_agent_workspace(agent_name)
 
         if os.path.exists(workspace_path):
-            shutil.rmtree(workspace_path)
-            os.makedirs(workspace_path)
-            self.logger.info(f"Cleared workspace: {workspace_path}")
+            self._replace_workspace(agent_name, workspace_path)
+            self.logger.info("Cleared workspace: %s", workspace_path)
 
     def copy_to_workspace(
         self, agent_name: str, source_path: str, dest_filename: str
@@ -209,8 +507,10 @@ class WorkspaceManager:
         # Create subdirectories if needed
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
 
-        shutil.copy2(source_path, dest_path)
-        self.logger.info(f"Copied {source_path} to {dest_path}")
+        # Contents only: copyfile uses sendfile on Linux and skips copystat
+        shutil.copyfile(source_path, dest_path)
+        self._cache_pop(dest_path)
+        self.logger.info("Copied %s to %s", source_path, dest_path)
         return dest_path
 
     def get_workspace_size(self, agent_name: str) -> int:
@@ -224,14 +524,128 @@ class WorkspaceManager:
             int: Total size in bytes
         """
         workspace_path = self.get_agent_workspace(agent_name)
-        total_size = 0
 
-        for dirpath, dirnames, filenames in os.walk(workspace_path):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                total_size += os.path.getsize(file_path)
+        return sum(
+            entry.stat(follow_symlinks=False).st_size
+            for _, entry in _iter_entries(workspace_path)
+        )
+
+    def _replace_workspace(self, agent_name: str, workspace_path: str) -> None:
+        """
+        Swap a workspace for an empty directory and delete the old one.
+
+        The old directory is renamed aside to a hidden sibling and removed
+        by a background thread, so the caller does not wait for the
+        deletion. If the rename fails, the directory is removed in place.
+
+        Args:
+            agent_name (str): Name of the agent
+            workspace_path (str): Path to the workspace directory
+        """
+        self._created.discard(workspace_path)
+        self._invalidate_cache(workspace_path)
+
+        trash_path = os.path.join(
+            self.base_dir,
+            f".{os.path.basename(workspace_path)}.trash.{uuid.uuid4().hex}"
+        )
+        try:
+            os.rename(workspace_path, trash_path)
+        except OSError:
+            _fast_rmtree(workspace_path)
+        else:
+            # Not a daemon thread, so the deletion finishes before exit
+            threading.Thread(
+                target=self._remove_trash,
+                args=(trash_path,),
+                name=f"workspace-cleanup-{agent_name.lower()}"
+            ).start()
+
+        self.get_agent_workspace(agent_name)
+
+    def _remove_trash(self, trash_path: str) -> None:
+        """
+        Delete a workspace directory that was renamed aside.
+
+        Args:
+            trash_path (str): Path to the renamed directory
+        """
+        try:
+            try:
+                _fast_rmtree(trash_path)
+            except RuntimeError:
+                # Thread pools take no new work once interpreter shutdown
+                # has begun; finish what is left single-threaded
+                shutil.rmtree(trash_path)
+        except OSError as e:
+            self.logger.error("Failed to remove old workspace %s: %s", trash_path, e)
+
+    def _cache_get(self, file_path: str, st: os.stat_result) -> Optional[str]:
+        """
+        Look up cached file contents, if still valid.
+
+        Args:
+            file_path (str): Full path of the file
+            st (os.stat_result): Current stat result of the file
+
+        Returns:
+            Optional[str]: Cached contents, or None on a miss or stale entry
+        """
+        with self._cache_lock:
+            cached = self._content_cache.get(file_path)
+            if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+                return None
+            self._content_cache.move_to_end(file_path)
+            return cached[2]
+
+    def _cache_put(self, file_path: str, st: os.stat_result, content: str) -> None:
+        """
+        Cache file contents, evicting least recently used entries over the limit.
+
+        Args:
+            file_path (str): Full path of the file
+            st (os.stat_result): Stat result matching the contents
+            content (str): Decoded file contents
+        """
+        with self._cache_lock:
+            old = self._content_cache.pop(file_path, None)
+            if old is not None:
+                self._content_cache_bytes -= old[1]
+
+            if st.st_size > self._content_cache_limit:
+                return
 
-        return total_size
+            self._content_cache[file_path] = (st.st_mtime_ns, st.st_size, content)
+            self._content_cache_bytes += st.st_size
+
+            while self._content_cache_bytes > self._content_cache_limit:
+                _, (_, size, _) = self._content_cache.popitem(last=False)
+                self._content_cache_bytes -= size
+
+    def _cache_pop(self, file_path: str) -> None:
+        """
+        Drop the cached contents of a file.
+
+        Args:
+            file_path (str): Full path of the file
+        """
+        with self._cache_lock:
+            old = self._content_cache.pop(file_path, None)
+            if old is not None:
+                self._content_cache_bytes -= old[1]
+
+    def _invalidate_cache(self, workspace_path: str) -> None:
+        """
+        Drop cached contents of all files under a workspace.
+
+        Args:
+            workspace_path (str): Path to the workspace directory
+        """
+        prefix = workspace_path + os.sep
+        with self._cache_lock:
+            stale = [p for p in self._content_cache if p.startswith(prefix)]
+        for file_path in stale:
+            self._cache_pop(file_path)
 
     def __repr__(self) -> str:
         """String representation of the workspace manager."""
@@ -1,5 +1,5 @@
 """Tools for agents."""
 
-from .github_tools import GitHubClient, get_github_client
+from .github_tools import AsyncGitHubClient, GitHubClient, get_github_client
 
-__all__ = ["GitHubClient", "get_github_client"]
+__all__ = ["AsyncGitHubClient", "GitHubClient", "get_github_client"]
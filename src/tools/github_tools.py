@@ -6,25 +6,41 @@ including creating issues, pull requests, and managing project boards.
 """
 
 import os
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from dotenv import load_dotenv
 
 load_dotenv()
 logger = logging.getLogger(__name__)
+_GH_LOGGER = logging.getLogger(f"{__name__}.GitHubClient")
+_ASYNC_GH_LOGGER = logging.getLogger(f"{__name__}.AsyncGitHubClient")
 
 # Note: GitHub integration requires PyGithub or requests library
 # For now, we'll create the structure and placeholder implementations
 # Run: uv pip install PyGithub to enable full functionality
 
 try:
-    from github import Github, GithubException
+    from github import Auth, Github, GithubException
     GITHUB_AVAILABLE = True
 except ImportError:
     logger.warning("PyGithub not installed. GitHub tools will use mock mode.")
     GITHUB_AVAILABLE = False
     GithubException = Exception
 
+# Marks GitHubClient.repo as not looked up yet (None is a valid value)
+_UNSET = object()
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    logger.warning("httpx not installed. AsyncGitHubClient will use mock mode.")
+    HTTPX_AVAILABLE = False
+
 
 class GitHubClient:
     """
@@ -37,6 +53,14 @@ class GitHubClient:
     - Adding labels and assignees
     """
 
+    __slots__ = (
+        "token", "repo_name", "logger", "client", "_repo", "_repo_error",
+        "_repo_lock", "_issue_cache", "__weakref__"
+    )
+
+    # Maximum number of issues kept for conditional re-fetching
+    ISSUE_CACHE_SIZE = 256
+
     def __init__(self, token: Optional[str] = None, repo_name: Optional[str] = None):
         """
         Initialize GitHub client.
@@ -47,21 +71,62 @@ class GitHubClient:
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.repo_name = repo_name or os.getenv("GITHUB_REPO")
-        self.logger = logging.getLogger(f"{__name__}.GitHubClient")
+        self.logger = _GH_LOGGER
+        self._repo = _UNSET
+        self._repo_error: Optional[Exception] = None
+        self._repo_lock = threading.Lock()
+
+        # issue number -> Issue, revalidated with its ETag on each get_issue()
+        self._issue_cache: "OrderedDict[int, Any]" = OrderedDict()
 
         if not self.token:
             self.logger.warning("No GitHub token provided. API calls will fail.")
 
         if GITHUB_AVAILABLE and self.token:
-            self.client = Github(self.token)
-            if self.repo_name:
-                self.repo = self.client.get_repo(self.repo_name)
-                self.logger.info(f"Connected to GitHub repo: {self.repo_name}")
+            # PyGithub keeps a pooled requests.Session, so connections are
+            # reused across calls
+            self.client = Github(auth=Auth.Token(self.token), per_page=100)
         else:
             self.client = None
-            self.repo = None
             self.logger.warning("GitHub client in mock mode")
 
+    @property
+    def repo(self):
+        """
+        Repository handle, looked up on first access.
+
+        Deferring the lookup keeps construction free of network calls for
+        clients that are never used. The lookup runs once, even when several
+        threads use the client at the same time; if it fails, the error is
+        logged and raised again on every later access, as a failed lookup
+        used to make the client unusable.
+
+        Returns:
+            Repository: PyGithub repository, or None in mock mode or when
+                no repository name is configured
+
+        Raises:
+            GithubException: If the repository lookup failed
+        """
+        if self._repo is _UNSET:
+            with self._repo_lock:
+                if self._repo is _UNSET and self._repo_error is None:
+                    if self.client is None or not self.repo_name:
+                        self._repo = None
+                    else:
+                        try:
+                            self._repo = self.client.get_repo(self.repo_name)
+                        except GithubException as e:
+                            self.logger.error(
+                                "Failed to connect to GitHub repo %s: %s", self.repo_name, e
+                            )
+                            self._repo_error = e
+                        else:
+                            self.logger.info("Connected to GitHub repo: %s", self.repo_name)
+                if self._repo_error is not None:
+                    raise self._repo_error
+        return self._repo
+
     def create_issue(
         self,
         title: str,
@@ -98,7 +163,7 @@ class GitHubClient:
                 assignees=assignees or []
             )
 
-            self.logger.info(f"Created issue #{issue.number}: {title}")
+            self.logger.info("Created issue #%s: %s", issue.number, title)
 
             return {
                 "number": issue.number,
@@ -107,7 +172,7 @@ class GitHubClient:
                 "state": issue.state
             }
         except GithubException as e:
-            self.logger.error(f"Failed to create issue: {str(e)}")
+            self.logger.error("Failed to create issue: %s", e)
             raise
 
     def create_pull_request(
@@ -146,7 +211,7 @@ class GitHubClient:
                 base=base_branch
             )
 
-            self.logger.info(f"Created PR #{pr.number}: {title}")
+            self.logger.info("Created PR #%s: %s", pr.number, title)
 
             return {
                 "number": pr.number,
@@ -155,7 +220,7 @@ class GitHubClient:
                 "state": pr.state
             }
         except GithubException as e:
-            self.logger.error(f"Failed to create PR: {str(e)}")
+            self.logger.error("Failed to create PR: %s", e)
             raise
 
     def add_pr_comment(self, pr_number: int, comment: str) -> Dict[str, Any]:
@@ -177,7 +242,7 @@ class GitHubClient:
             pr = self.repo.get_pull(pr_number)
             comment_obj = pr.create_issue_comment(comment)
 
-            self.logger.info(f"Added comment to PR #{pr_number}")
+            self.logger.info("Added comment to PR #%s", pr_number)
 
             return {
                 "id": comment_obj.id,
@@ -185,7 +250,7 @@ class GitHubClient:
                 "created_at": str(comment_obj.created_at)
             }
         except GithubException as e:
-            self.logger.error(f"Failed to add comment: {str(e)}")
+            self.logger.error("Failed to add comment: %s", e)
             raise
 
     def add_pr_review(
@@ -213,7 +278,7 @@ class GitHubClient:
             pr = self.repo.get_pull(pr_number)
             review = pr.create_review(body=body, event=event)
 
-            self.logger.info(f"Added {event} review to PR #{pr_number}")
+            self.logger.info("Added %s review to PR #%s", event, pr_number)
 
             return {
                 "id": review.id,
@@ -221,13 +286,17 @@ class GitHubClient:
                 "body": review.body
             }
         except GithubException as e:
-            self.logger.error(f"Failed to add review: {str(e)}")
+            self.logger.error("Failed to add review: %s", e)
             raise
 
     def get_issue(self, issue_number: int) -> Dict[str, Any]:
         """
         Get details of a GitHub issue.
 
+        Issues fetched before are revalidated with a conditional request
+        (If-None-Match), which transfers no body and does not count
+        against the rate limit when the issue is unchanged.
+
         Args:
             issue_number (int): Issue number
 
@@ -243,7 +312,15 @@ class GitHubClient:
             }
 
         try:
-            issue = self.repo.get_issue(issue_number)
+            issue = self._issue_cache.get(issue_number)
+            if issue is None:
+                issue = self.repo.get_issue(issue_number)
+                self._issue_cache[issue_number] = issue
+                if len(self._issue_cache) > self.ISSUE_CACHE_SIZE:
+                    self._issue_cache.popitem(last=False)
+            else:
+                issue.update()
+                self._issue_cache.move_to_end(issue_number)
 
             return {
                 "number": issue.number,
@@ -254,7 +331,7 @@ class GitHubClient:
                 "assignees": [assignee.login for assignee in issue.assignees]
             }
         except GithubException as e:
-            self.logger.error(f"Failed to get issue: {str(e)}")
+            self.logger.error("Failed to get issue: %s", e)
             raise
 
     def list_open_issues(self, labels: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -277,17 +354,33 @@ class GitHubClient:
             else:
                 issues = self.repo.get_issues(state="open")
 
-            return [
-                {
-                    "number": issue.number,
-                    "title": issue.title,
-                    "labels": [label.name for label in issue.labels],
-                    "assignees": [assignee.login for assignee in issue.assignees]
-                }
-                for issue in issues
-            ]
+            # Fetch the next page in the background while the current one
+            # is converted; a short page means it was the last one.
+            per_page = self.client.per_page
+            results = []
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                page_number = 0
+                next_page = executor.submit(issues.get_page, page_number)
+                while True:
+                    page = next_page.result()
+                    if len(page) == per_page:
+                        page_number += 1
+                        next_page = executor.submit(issues.get_page, page_number)
+
+                    results.extend(
+                        {
+                            "number": issue.number,
+                            "title": issue.title,
+                            "labels": [label.name for label in issue.labels],
+                            "assignees": [assignee.login for assignee in issue.assignees]
+                        }
+                        for issue in page
+                    )
+
+                    if len(page) < per_page:
+                        return results
         except GithubException as e:
-            self.logger.error(f"Failed to list issues: {str(e)}")
+            self.logger.error("Failed to list issues: %s", e)
             raise
 
     def close_issue(self, issue_number: int, comment: Optional[str] = None) -> None:
@@ -309,11 +402,275 @@ class GitHubClient:
                 issue.create_comment(comment)
 
             issue.edit(state="closed")
-            self.logger.info(f"Closed issue #{issue_number}")
+            self.logger.info("Closed issue #%s", issue_number)
         except GithubException as e:
-            self.logger.error(f"Failed to close issue: {str(e)}")
+            self.logger.error("Failed to close issue: %s", e)
             raise
 
+    def batch_create(
+        self,
+        issues: Optional[List[Dict[str, Any]]] = None,
+        pull_requests: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Create several issues and pull requests.
+
+        Each entry holds the keyword arguments of create_issue() or
+        create_pull_request(). Requests are sent one at a time: GitHub asks
+        clients to make mutating requests serially to avoid secondary rate
+        limits, and PyGithub's spacing between writes (seconds_between_writes)
+        is not thread-safe.
+
+        Args:
+            issues (List[Dict[str, Any]], optional): Issues to create
+            pull_requests (List[Dict[str, Any]], optional): PRs to create
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Created "issues" and
+                "pull_requests", in the order given
+
+        Raises:
+            GithubException: If a creation fails; later entries are not sent
+        """
+        return {
+            "issues": [self.create_issue(**kwargs) for kwargs in issues or []],
+            "pull_requests": [
+                self.create_pull_request(**kwargs) for kwargs in pull_requests or []
+            ]
+        }
+
+
+class AsyncGitHubClient:
+    """
+    Asynchronous client for the GitHub issue endpoints.
+
+    Talks to the GitHub REST API directly over a pooled httpx.AsyncClient,
+    so that many requests can be in flight at once (see get_issues_bulk).
+    Returns the same dictionaries as GitHubClient and falls back to the
+    same mock responses when no token or repository is configured.
+
+    Use as an async context manager, or call aclose() when done.
+    """
+
+    __slots__ = ("token", "repo_name", "logger", "_http", "__weakref__")
+
+    API_URL = "https://api.github.com"
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        repo_name: Optional[str] = None,
+        max_connections: int = 20
+    ):
+        """
+        Initialize the async GitHub client.
+
+        Args:
+            token (str, optional): GitHub personal access token
+            repo_name (str, optional): Repository name in format "owner/repo"
+            max_connections (int): Maximum number of concurrent connections
+        """
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        self.repo_name = repo_name or os.getenv("GITHUB_REPO")
+        self.logger = _ASYNC_GH_LOGGER
+
+        if HTTPX_AVAILABLE and self.token and self.repo_name:
+            self._http = httpx.AsyncClient(
+                base_url=f"{self.API_URL}/repos/{self.repo_name}",
+                headers={
+                    "Authorization": f"Bearer {self.token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                timeout=15.0,
+                limits=httpx.Limits(max_connections=max_connections)
+            )
+        else:
+            self._http = None
+            self.logger.warning("Async GitHub client in mock mode")
+
+    @staticmethod
+    def _issue_details(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an issue payload from the REST API to an issue dictionary.
+
+        Args:
+            data (Dict[str, Any]): Issue JSON returned by GitHub
+
+        Returns:
+            Dict[str, Any]: Issue details
+        """
+        return {
+            "number": data["number"],
+            "title": data["title"],
+            "body": data.get("body"),
+            "state": data["state"],
+            "labels": [label["name"] for label in data.get("labels", [])],
+            "assignees": [assignee["login"] for assignee in data.get("assignees", [])]
+        }
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """
+        Send a request relative to the repository URL.
+
+        Args:
+            method (str): HTTP method
+            path (str): Path below /repos/{owner}/{repo}
+            **kwargs: Extra arguments for httpx.AsyncClient.request()
+
+        Returns:
+            Any: Decoded JSON response
+
+        Raises:
+            httpx.HTTPStatusError: If GitHub returns an error status
+        """
+        response = await self._http.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def create_issue(
+        self,
+        title: str,
+        body: str,
+        labels: Optional[List[str]] = None,
+        assignees: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a GitHub issue.
+
+        Args:
+            title (str): Issue title
+            body (str): Issue description
+            labels (List[str], optional): List of label names
+            assignees (List[str], optional): List of GitHub usernames
+
+        Returns:
+            Dict[str, Any]: Issue details including number and URL
+        """
+        if self._http is None:
+            self.logger.warning("GitHub not available. Returning mock issue.")
+            return {
+                "number": 1,
+                "url": "https://github.com/mock/issue/1",
+                "title": title,
+                "state": "open"
+            }
+
+        try:
+            issue = await self._request(
+                "POST",
+                "/issues",
+                json={
+                    "title": title,
+                    "body": body,
+                    "labels": labels or [],
+                    "assignees": assignees or []
+                }
+            )
+
+            self.logger.info("Created issue #%s: %s", issue['number'], title)
+
+            return {
+                "number": issue["number"],
+                "url": issue["html_url"],
+                "title": issue["title"],
+                "state": issue["state"]
+            }
+        except httpx.HTTPError as e:
+            self.logger.error("Failed to create issue: %s", e)
+            raise
+
+    async def get_issue(self, issue_number: int) -> Dict[str, Any]:
+        """
+        Get details of a GitHub issue.
+
+        Args:
+            issue_number (int): Issue number
+
+        Returns:
+            Dict[str, Any]: Issue details
+        """
+        if self._http is None:
+            self.logger.warning("GitHub not available. Returning mock issue.")
+            return {
+                "number": issue_number,
+                "title": "Mock Issue",
+                "state": "open"
+            }
+
+        try:
+            return self._issue_details(await self._request("GET", f"/issues/{issue_number}"))
+        except httpx.HTTPError as e:
+            self.logger.error("Failed to get issue: %s", e)
+            raise
+
+    async def get_issues_bulk(self, issue_numbers: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get details of several GitHub issues concurrently.
+
+        Args:
+            issue_numbers (List[int]): Issue numbers
+
+        Returns:
+            List[Dict[str, Any]]: Issue details, in the order given
+        """
+        return list(await asyncio.gather(
+            *(self.get_issue(number) for number in issue_numbers)
+        ))
+
+    async def list_open_issues(self, labels: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        List open issues, optionally filtered by labels.
+
+        Args:
+            labels (List[str], optional): Filter by these labels
+
+        Returns:
+            List[Dict[str, Any]]: List of issue details
+        """
+        if self._http is None:
+            self.logger.warning("GitHub not available. Returning empty list.")
+            return []
+
+        params = {"state": "open", "per_page": 100}
+        if labels:
+            params["labels"] = ",".join(labels)
+
+        try:
+            results = []
+            page_number = 1
+            while True:
+                page = await self._request(
+                    "GET", "/issues", params={**params, "page": page_number}
+                )
+                results.extend(
+                    {
+                        "number": issue["number"],
+                        "title": issue["title"],
+                        "labels": [label["name"] for label in issue["labels"]],
+                        "assignees": [assignee["login"] for assignee in issue["assignees"]]
+                    }
+                    for issue in page
+                )
+
+                if len(page) < params["per_page"]:
+                    return results
+                page_number += 1
+        except httpx.HTTPError as e:
+            self.logger.error("Failed to list issues: %s", e)
+            raise
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        if self._http is not None:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
 
 # Convenience function to create a client
 def get_github_client(
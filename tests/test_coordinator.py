@@ -0,0 +1,166 @@
+"""
+Tests for the Agent Coordinator workflow engine.
+"""
+
+import time
+
+import pytest
+
+from src.orchestrator.coordinator import AgentCoordinator, TaskStatus
+from src.orchestrator.workspace import WorkspaceManager
+
+
+class StubAgent:
+    """Agent that sleeps for a fixed time, then returns or raises."""
+
+    def __init__(
+        self, name: str, delay: float = 0.0, fail: bool = False, log=None
+    ):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.log = log if log is not None else []
+        self.finished = []
+
+    def execute(self, task: str) -> str:
+        self.log.append(("start", task))
+        time.sleep(self.delay)
+        self.log.append(("end", task))
+        if self.fail:
+            raise Exception(f"{self.name} failed")
+        self.finished.append(task)
+        return f"{self.name}: {task}"
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    """Coordinator with its own temporary workspace."""
+    return AgentCoordinator(WorkspaceManager(str(tmp_path)))
+
+
+def _statuses(coordinator):
+    return {
+        task.description: task.status for task in coordinator.tasks.values()
+    }
+
+
+def test_independent_steps_run_in_parallel(coordinator):
+    for name in ("a", "b", "c"):
+        coordinator.register_agent(name, StubAgent(name, delay=0.3))
+
+    steps = [
+        {"agent_name": name, "description": name, "depends_on": []}
+        for name in ("a", "b", "c")
+    ]
+
+    start = time.perf_counter()
+    results = coordinator.execute_workflow(steps)
+    elapsed = time.perf_counter() - start
+
+    assert results == ["a: a", "b: b", "c: c"]
+    assert elapsed < 0.6
+
+
+def test_steps_without_depends_on_run_sequentially(coordinator):
+    log = []
+    for name in ("a", "b", "c"):
+        coordinator.register_agent(name, StubAgent(name, delay=0.05, log=log))
+
+    steps = [
+        {"agent_name": name, "description": name} for name in ("a", "b", "c")
+    ]
+
+    results = coordinator.execute_workflow(steps)
+
+    assert results == ["a: a", "b: b", "c: c"]
+    assert log == [
+        ("start", "a"), ("end", "a"),
+        ("start", "b"), ("end", "b"),
+        ("start", "c"), ("end", "c"),
+    ]
+
+
+def test_cyclic_dependencies_are_rejected(coordinator):
+    coordinator.register_agent("a", StubAgent("a"))
+    steps = [
+        {"agent_name": "a", "description": "first"},
+        {"agent_name": "a", "description": "second"},
+    ]
+
+    with pytest.raises(ValueError, match="cycle"):
+        coordinator.execute_workflow(steps, dependencies={0: [1]})
+
+    assert coordinator.tasks == {}
+
+
+@pytest.mark.parametrize("dep", [1, -1, 0])
+def test_invalid_dependencies_are_rejected(coordinator, dep):
+    coordinator.register_agent("a", StubAgent("a"))
+    steps = [{"agent_name": "a", "description": "only", "depends_on": [dep]}]
+
+    with pytest.raises(ValueError, match="invalid dependency"):
+        coordinator.execute_workflow(steps)
+
+    assert coordinator.tasks == {}
+
+
+def test_failure_skips_dependents_and_finishes_running_steps(coordinator):
+    slow = StubAgent("slow", delay=0.2)
+    after = StubAgent("after")
+    coordinator.register_agent("bad", StubAgent("bad", delay=0.05, fail=True))
+    coordinator.register_agent("slow", slow)
+    coordinator.register_agent("after", after)
+
+    steps = [
+        {"agent_name": "bad", "description": "boom", "depends_on": []},
+        {"agent_name": "slow", "description": "independent", "depends_on": []},
+        {"agent_name": "after", "description": "after boom", "depends_on": [0]},
+    ]
+
+    with pytest.raises(RuntimeError, match="bad failed"):
+        coordinator.execute_workflow(steps)
+
+    assert _statuses(coordinator) == {
+        "boom": TaskStatus.FAILED,
+        "independent": TaskStatus.COMPLETED,
+    }
+    assert slow.finished == ["independent"]
+    assert after.finished == []
+
+
+def test_failure_lets_running_prerequisite_finish(coordinator):
+    slow = StubAgent("a", delay=0.2)
+    coordinator.register_agent("a", slow)
+    coordinator.register_agent("bad", StubAgent("bad", delay=0.05, fail=True))
+    coordinator.register_agent("c", StubAgent("c"))
+
+    steps = [
+        {"agent_name": "a", "description": "slow", "depends_on": []},
+        {"agent_name": "bad", "description": "boom", "depends_on": []},
+        {"agent_name": "c", "description": "after slow", "depends_on": [0]},
+    ]
+
+    with pytest.raises(RuntimeError, match="bad failed"):
+        coordinator.execute_workflow(steps)
+
+    assert _statuses(coordinator) == {
+        "slow": TaskStatus.COMPLETED,
+        "boom": TaskStatus.FAILED,
+    }
+    assert slow.finished == ["slow"]
+    assert coordinator.tasks["task_0001"].result == "a: slow"
+
+
+@pytest.mark.asyncio
+async def test_execute_workflow_under_running_loop(coordinator):
+    coordinator.register_agent("a", StubAgent("a"))
+    coordinator.register_agent("b", StubAgent("b"))
+    steps = [
+        {"agent_name": "a", "description": "first"},
+        {"agent_name": "b", "description": "second"},
+    ]
+
+    results = coordinator.execute_workflow(steps)
+
+    assert results == ["a: first", "b: second"]
+    assert coordinator.get_workflow_summary()["status_counts"]["completed"] == 2